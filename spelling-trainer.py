@@ -2,97 +2,246 @@ from __future__ import annotations
 
 import argparse
 import csv
+import io
+import os
 import platform
 import random
 import re
 import shutil
 import subprocess
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
 from colorama import Fore, Style, init
 
 init(autoreset=True)
 
-DATE_SEP = "|"
+DATE_SEP = "|"  # separates the days in the legacy "history" column
+WORD_COLUMNS = ("word", "phrase", "streak", "last_day", "interval_days", "due_on")
 MASTERY_STREAK = 5
+MAX_INTERVAL_DAYS = 180
 DEFAULT_DATA_DIR = Path("data")
+CSV_BUFFER_SIZE = 1 << 20  # 1 MiB read buffer for the CSV files
 
 
 # ----------------------------
 # Data model
 # ----------------------------
+# Days are handled as date ordinals (plain ints) in memory, so "reviewed
+# today?" is an int compare; files and the journal keep YYYY-MM-DD.
+def to_ordinal(day: str) -> int:
+    return date.fromisoformat(day).toordinal()
+
+
+def to_isoday(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
+
+
 @dataclass
 class WordEntry:
     word: str
     phrase: str
-    history: list[str]  # YYYY-MM-DD strings
-
-    @property
-    def streak(self) -> int:
-        return len(self.history)
+    streak: int = 0  # correct answers in a row
+    last_day: int | None = None  # date ordinal of the last correct answer
+    # Spaced repetition: a correct answer doubles the interval, a wrong one
+    # resets it; the word is only asked again once `due_on` is reached
+    interval_days: int = 1
+    due_on: int = 0  # date ordinal; 0 = due right away
+
+    # Derived for the current day; set by refresh() so the review/list
+    # loops can read plain attributes instead of recomputing.
+    _mastered: bool = field(default=False, init=False, repr=False, compare=False)
+    _reviewed_today: bool = field(default=False, init=False, repr=False, compare=False)
+    # Case-insensitive sort key; the word itself never changes
+    _word_lower: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._word_lower = self.word.lower()
 
     @property
     def mastered(self) -> bool:
         return self.streak >= MASTERY_STREAK
 
-    def reviewed_today(self, today: str) -> bool:
-        return bool(self.history) and self.history[-1] == today
+    def reviewed_today(self, today: int) -> bool:
+        return self.last_day == today
 
     def last_review(self) -> str | None:
-        return self.history[-1] if self.history else None
+        return to_isoday(self.last_day) if self.last_day else None
+
+    def refresh(self, today: int) -> None:
+        self._mastered = self.mastered
+        self._reviewed_today = self.reviewed_today(today)
 
 
 # ----------------------------
 # i18n (Key,English,German)
 # ----------------------------
 class I18N:
-    def __init__(self, language: str, translations: dict[str, dict[str, str]]):
+    def __init__(self, language: str, translations: dict[str, str]):
         self.language = language
-        self.translations = translations
+        self.translations = translations  # key -> text in `language`
+        # (key, sorted kwargs) -> formatted text; the language is fixed per run
+        self._cache: dict[tuple, str] = {}
 
     def t(self, key: str, **kwargs) -> str:
-        entry = self.translations.get(key)
-        if not entry:
-            # Make missing keys obvious during development
-            text = key
-        else:
-            text = entry.get(self.language) or entry.get("en") or key
+        cache_key = (key, tuple(sorted(kwargs.items()))) if kwargs else key
         try:
-            return text.format(**kwargs)
+            return self._cache[cache_key]
         except KeyError:
-            # If formatting vars are missing, still show something useful
-            return text
+            pass
+        except TypeError:
+            # Unhashable formatting vars: just don't cache this call
+            return self._render(key, kwargs)
+
+        text = self._render(key, kwargs)
+        self._cache[cache_key] = text
+        return text
+
+    def formatter(self, key: str):
+        """Resolve `key` once and return a function formatting it, for per-row use in loops."""
+        # Missing keys render as the key itself, to make them obvious during development
+        text = self.translations.get(key, key)
+
+        def fmt(**kwargs) -> str:
+            try:
+                return text.format(**kwargs)
+            except KeyError:
+                # If formatting vars are missing, still show something useful
+                return text
+
+        return fmt
+
+    def _render(self, key: str, kwargs: dict) -> str:
+        return self.formatter(key)(**kwargs)
 
 
-def load_translations_csv(path: Path) -> dict[str, dict[str, str]]:
+LANGUAGE_COLUMNS = {"en": "English", "de": "German"}
+
+
+def load_translations_csv(path: Path, language: str) -> dict[str, str]:
     """
     CSV columns: Key,English,German
-    Returns: { key: { "en": English, "de": German } }
+    Returns: { key: text in `language` } (falling back to English, then the key)
     """
     if not path.exists():
         return {}
 
-    out: dict[str, dict[str, str]] = {}
-    with path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    out: dict[str, str] = {}
+    with path.open("r", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return out
+        ik, ilang, ien = _column_indices(
+            header, "Key", LANGUAGE_COLUMNS.get(language, "English"), "English"
+        )
         for row in reader:
-            key = (row.get("Key") or "").strip()
-            en = (row.get("English") or "").strip()
-            de = (row.get("German") or "").strip()
+            key = _clean(_cell(row, ik))
             if key:
-                out[key] = {"en": en, "de": de}
+                out[key] = _clean(_cell(row, ilang)) or _clean(_cell(row, ien)) or key
     return out
 
 
+def _column_indices(header: list[str], *names: str) -> tuple[int, ...]:
+    """Position of each named column in a CSV header (-1 if absent)."""
+    header = [h.strip() for h in header]
+    return tuple(header.index(name) if name in header else -1 for name in names)
+
+
+def _cell(row: list[str], idx: int) -> str:
+    return row[idx] if 0 <= idx < len(row) else ""
+
+
+def _clean(s: str) -> str:
+    # Same result as s.strip(), but skips the call for the (usual) clean cell
+    return s.strip() if s and (s[0].isspace() or s[-1].isspace()) else s
+
+
 # ----------------------------
 # TTS Speaker (Windows + Linux)
 # ----------------------------
 import subprocess
 import platform
 import shutil
+import threading
+from queue import Empty, Queue
+
+try:
+    import speechd  # speech-dispatcher client (python3-speechd), optional
+except ImportError:
+    speechd = None
+
+# speech-dispatcher reports the end of a message through a callback; if that
+# never comes (lost connection, broken output module) stop waiting after
+# well over the time the text could take to speak
+SPEECHD_TIMEOUT_BASE = 5.0
+SPEECHD_TIMEOUT_PER_CHAR = 0.15
+
+
+class _SpeechdUtterance:
+    """Popen-like handle for one message sent over a speech-dispatcher connection."""
+
+    def __init__(self, client, text: str):
+        self._client = client
+        self._done = threading.Event()
+        self._timeout = SPEECHD_TIMEOUT_BASE + SPEECHD_TIMEOUT_PER_CHAR * len(text)
+
+    def on_event(self, event_type, **kwargs) -> None:
+        self._done.set()
+
+    def poll(self) -> int | None:
+        return 0 if self._done.is_set() else None
+
+    def terminate(self) -> None:
+        self._client.cancel()
+        self._done.set()
+
+    def wait(self) -> int:
+        if not self._done.wait(self._timeout):
+            raise subprocess.TimeoutExpired("speech-dispatcher", self._timeout)
+        return 0
+
+
+class _PowerShellUtterance:
+    """Popen-like handle for one prompt sent to the long-lived PowerShell speaker."""
+
+    def __init__(self, ps: subprocess.Popen):
+        self._ps = ps
+
+    def poll(self) -> int | None:
+        # The host keeps running between prompts; stop() then just sends a cancel
+        return self._ps.poll()
+
+    def terminate(self) -> None:
+        _ps_send(self._ps, "C")
+
+    def wait(self) -> int:
+        # Poll instead of letting the host block until the prompt ends, so it
+        # keeps reading stdin and a cancel from stop() takes effect at once
+        while _ps_send(self._ps, "W"):
+            if self._ps.stdout.readline().strip() != "busy":
+                break
+            time.sleep(0.02)
+        return 0
+
+
+_PS_SEND_LOCK = threading.Lock()
+
+
+def _ps_send(ps: subprocess.Popen, line: str) -> bool:
+    # Called from both the speaker thread and stop() on the main thread
+    with _PS_SEND_LOCK:
+        try:
+            ps.stdin.write(line + "\n")
+            ps.stdin.flush()
+            return True
+        except (OSError, ValueError):
+            return False
+
 
 class Speaker:
     def __init__(self, enabled: bool, language: str):
@@ -100,65 +249,203 @@ class Speaker:
         self.language = language  # "en" or "de"
         self._warned = False
         self._is_windows = platform.system().lower().startswith("win")
-        self._proc: subprocess.Popen | None = None
-
-    def stop(self) -> None:
-        """Stop any current speech."""
-        if self._proc and self._proc.poll() is None:
+        self._proc: subprocess.Popen | _SpeechdUtterance | _PowerShellUtterance | None = None
+        # Engines are started by the first speak_async() (see _start_engines),
+        # so commands that never speak don't connect to or spawn anything
+        self._started = False
+        self._client = None
+        self._ps: subprocess.Popen | None = None
+        self._espeak_ng: str | None = None
+        self._linux_cmd: list[str] | None = None
+        self._standby: subprocess.Popen | None = None
+        # Texts are spoken one after another by a background thread, so the
+        # review loop never blocks on an engine; stop() bumps the generation
+        # to drop whatever was queued before it
+        self._queue: Queue[tuple[int, str]] = Queue()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._worker: threading.Thread | None = None
+
+    def close(self) -> None:
+        """Stop speaking and release the speech-dispatcher connection / PowerShell host / idle espeak-ng."""
+        self.stop()
+        self._drop_speechd()
+        if self._ps is not None:
+            # EOF ends the host's read loop, and with it the process
             try:
-                self._proc.terminate()
-            except Exception:
+                self._ps.stdin.close()
+            except OSError:
                 pass
-        self._proc = None
+            self._ps = None
+        if self._standby is not None:
+            self._standby.kill()
+            self._standby.wait()
+            self._standby = None
 
-    def speak_async(self, text: str) -> None:
-        """Start speaking and return immediately."""
+    def stop(self) -> None:
+        """Stop any current speech and drop everything still queued."""
+        with self._lock:
+            self._generation += 1
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except Empty:
+                    break
+                self._queue.task_done()
+            if self._proc and self._proc.poll() is None:
+                try:
+                    self._proc.terminate()
+                except Exception:
+                    pass
+            self._proc = None
+
+    def speak_async(self, text: str, interrupt: bool = True) -> None:
+        """
+        Queue text and return immediately. With interrupt=True (the default)
+        current and queued speech is stopped first; otherwise the text is
+        spoken after it.
+        """
         if not self.enabled:
             return
         text = (text or "").strip()
         if not text:
             return
 
-        # Stop any previous prompt so prompts don't overlap
-        self.stop()
+        if not self._started:
+            self._start_engines()
 
-        if self._is_windows:
-            self._proc = self._spawn_windows(text)
-        else:
-            self._proc = self._spawn_linux(text)
+        if interrupt:
+            # Stop any previous prompt so prompts don't overlap
+            self.stop()
 
-        if self._proc is None:
-            self._warn_once("[TTS] Could not start speech (no engine found).")
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="speaker", daemon=True)
+            self._worker.start()
+        self._queue.put((self._generation, text))
+
+    def flush(self) -> None:
+        """Block until everything queued so far has been spoken."""
+        if self._worker is not None:
+            self._queue.join()
 
     def speak_and_wait(self, text: str) -> None:
         self.speak_async(text)
-        if self._proc:
-            self._proc.wait()
+        self.flush()
 
     def speak_many_and_wait(self, parts: list[str], pause: str = ". ") -> None:
         merged = pause.join(p.strip() for p in parts if p and p.strip())
         self.speak_and_wait(merged)
 
-    def speak_many_async(self, parts: list[str], pause: str = ". ") -> None:
+    def speak_many_async(self, parts: list[str], pause: str = ". ", interrupt: bool = True) -> None:
         merged = pause.join(p.strip() for p in parts if p and p.strip())
-        self.speak_async(merged)
+        self.speak_async(merged, interrupt=interrupt)
+
+    def _run(self) -> None:
+        while True:
+            generation, text = self._queue.get()
+            try:
+                with self._lock:
+                    if generation != self._generation:
+                        continue  # dropped by stop() after it was queued
+                    if self._is_windows:
+                        self._proc = self._spawn_windows(text)
+                    else:
+                        self._proc = self._spawn_linux(text)
+                    proc = self._proc
+
+                if proc is None:
+                    self._warn_once("[TTS] Could not start speech (no engine found).")
+                else:
+                    try:
+                        proc.wait()
+                    except subprocess.TimeoutExpired:
+                        # speech-dispatcher stopped answering
+                        self._drop_speechd()
+            finally:
+                self._queue.task_done()
 
     # ---------- platform spawners ----------
 
-    def _spawn_windows(self, text: str) -> subprocess.Popen | None:
-        safe = text.replace('"', '`"')
+    def _start_engines(self) -> None:
+        self._started = True
+        if self._is_windows:
+            # One PowerShell host that loads System.Speech once and then reads
+            # prompts from stdin, instead of a new PowerShell per prompt
+            self._ps = self._start_powershell()
+            return
+        # One speech-dispatcher connection for the whole session, so prompts
+        # don't fork/exec spd-say every time
+        self._client = self._connect_speechd()
+        # The other Linux engines are looked up on PATH once here, not on
+        # every prompt. Without speech-dispatcher, keep an espeak-ng process
+        # started and waiting on stdin, so its startup and voice loading
+        # happen while the user is still typing rather than when the next
+        # prompt is due
+        self._espeak_ng = shutil.which("espeak-ng")
+        self._linux_cmd = self._find_linux_cmd()
+        if self._espeak_ng and self._client is None:
+            self._standby = self._start_espeak()
+
+    def _windows_prelude(self) -> str:
         culture_prefix = "de-*" if self.language == "de" else "en-*"
-
-        ps = (
+        return (
             "Add-Type -AssemblyName System.Speech; "
             "$synth = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
             "$voice = $synth.GetInstalledVoices() | "
             f"Where-Object {{ $_.VoiceInfo.Culture.Name -like '{culture_prefix}' }} | "
             "Select-Object -First 1; "
             "if ($voice) { $synth.SelectVoice($voice.VoiceInfo.Name) }; "
-            f"$synth.Speak(\"{safe}\");"
         )
 
+    def _start_powershell(self) -> subprocess.Popen | None:
+        # Line protocol on stdin: "S <text>" speak (cancelling the current
+        # prompt), "C" cancel, "W" reply "busy" while the current prompt is
+        # still playing, else "done".
+        ps = self._windows_prelude() + (
+            "$in = New-Object System.IO.StreamReader([Console]::OpenStandardInput(), [System.Text.Encoding]::UTF8); "
+            "$prompt = $null; "
+            "while (($line = $in.ReadLine()) -ne $null) { "
+            "  if ($line.StartsWith('S ')) { $synth.SpeakAsyncCancelAll(); $prompt = $synth.SpeakAsync($line.Substring(2)) } "
+            "  elseif ($line -eq 'C') { $synth.SpeakAsyncCancelAll() } "
+            "  elseif ($line -eq 'W') { "
+            "    if ($prompt -and -not $prompt.IsCompleted) { [Console]::Out.WriteLine('busy') } "
+            "    else { [Console]::Out.WriteLine('done') }; "
+            "    [Console]::Out.Flush() "
+            "  } "
+            "}; "
+            "while ($prompt -and -not $prompt.IsCompleted) { Start-Sleep -Milliseconds 20 }"
+        )
+        try:
+            return subprocess.Popen(
+                ["powershell", "-NoProfile", "-Command", ps],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+            )
+        except FileNotFoundError:
+            return None
+
+    def _speak_powershell(self, text: str) -> _PowerShellUtterance | None:
+        if self._ps.poll() is not None:
+            self._ps = None
+            return None
+        line = " ".join(text.splitlines())
+        if not _ps_send(self._ps, "S " + line):
+            self._ps = None
+            return None
+        return _PowerShellUtterance(self._ps)
+
+    def _spawn_windows(self, text: str) -> subprocess.Popen | _PowerShellUtterance | None:
+        if self._ps is not None:
+            utterance = self._speak_powershell(text)
+            if utterance is not None:
+                return utterance
+
+        safe = text.replace('"', '`"')
+        ps = self._windows_prelude() + f"$synth.Speak(\"{safe}\");"
+
         try:
             return subprocess.Popen(
                 ["powershell", "-NoProfile", "-Command", ps],
@@ -169,21 +456,94 @@ class Speaker:
             self._warn_once("[TTS] PowerShell not found; cannot speak on this Windows setup.")
             return None
 
-    def _spawn_linux(self, text: str) -> subprocess.Popen | None:
-        lang = "de" if self.language == "de" else "en"
+    def _connect_speechd(self):
+        if speechd is None:
+            return None
+        try:
+            client = speechd.SSIPClient("spelling-trainer")
+            client.set_language("de" if self.language == "de" else "en")
+            return client
+        except Exception:
+            # speech-dispatcher not running/reachable: use the command-line engines
+            return None
 
-        # IMPORTANT: no --wait here (we WANT it async)
-        if shutil.which("spd-say"):
-            return subprocess.Popen(["spd-say", "-l", lang, text],
-                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    def _drop_speechd(self) -> None:
+        # Without the client, _spawn_linux falls back to the command-line engines
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            try:
+                client.close()
+            except Exception:
+                pass
 
-        if shutil.which("espeak-ng"):
-            return subprocess.Popen(["espeak-ng", "-v", lang, text],
-                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    def _speak_speechd(self, text: str) -> _SpeechdUtterance | None:
+        utterance = _SpeechdUtterance(self._client, text)
+        try:
+            self._client.speak(
+                text,
+                callback=utterance.on_event,
+                event_types=(speechd.CallbackType.END, speechd.CallbackType.CANCEL),
+            )
+        except Exception:
+            self._client = None
+            return None
+        return utterance
 
-        if shutil.which("espeak"):
-            return subprocess.Popen(["espeak", "-v", lang, text],
+    def _start_espeak(self) -> subprocess.Popen | None:
+        lang = "de" if self.language == "de" else "en"
+        try:
+            return subprocess.Popen([self._espeak_ng, "-v", lang, "--stdin"],
+                                    stdin=subprocess.PIPE,
                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            return None
+
+    def _speak_espeak(self, text: str) -> subprocess.Popen | None:
+        proc, self._standby = self._standby, None
+        if proc is None or proc.poll() is not None:
+            proc = self._start_espeak()
+            if proc is None:
+                return None
+        try:
+            # EOF makes espeak-ng speak the text and exit, so the prompt can
+            # still be waited for / terminated like any other process
+            proc.stdin.write(text.encode("utf-8") + b"\n")
+            proc.stdin.close()
+        except OSError:
+            proc.kill()
+            return None
+        # Warm up the engine for the next prompt while this one plays
+        self._standby = self._start_espeak()
+        return proc
+
+    def _find_linux_cmd(self) -> list[str] | None:
+        """Command prefix of the one-shot fallback engine, if any is installed."""
+        lang = "de" if self.language == "de" else "en"
+        # IMPORTANT: no --wait for spd-say (we WANT it async)
+        for exe, lang_flag in (("spd-say", "-l"), ("espeak", "-v")):
+            found = shutil.which(exe)
+            if found:
+                return [found, lang_flag, lang]
+        return None
+
+    def _spawn_linux(self, text: str) -> subprocess.Popen | _SpeechdUtterance | None:
+        if self._client is not None:
+            utterance = self._speak_speechd(text)
+            if utterance is not None:
+                return utterance
+
+        if self._espeak_ng:
+            proc = self._speak_espeak(text)
+            if proc is not None:
+                return proc
+
+        if self._linux_cmd:
+            try:
+                return subprocess.Popen(self._linux_cmd + [text],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except OSError:
+                pass
 
         self._warn_once(
             "[TTS] No TTS engine found. On Ubuntu/Debian install:\n"
@@ -216,27 +576,71 @@ def setup_tts_ubuntu(run_install: bool, i18n: I18N) -> None:
 # ----------------------------
 # Terminal helpers
 # ----------------------------
+# Style prefixes, concatenated once at import time
+_SUCCESS = Fore.GREEN
+_BRIGHT = Style.BRIGHT
+_ERROR = Fore.RED + Style.BRIGHT
+_HIGHLIGHT = Fore.YELLOW + Style.BRIGHT
+_RESET = Style.RESET_ALL
+_HIGHLIGHT_REPL = _HIGHLIGHT + r"\g<0>" + _RESET
+
+
 def success(text: str) -> str:
-    return Fore.GREEN + text
+    return _SUCCESS + text
 
 
 def error(text: str) -> str:
-    return Fore.RED + Style.BRIGHT + text
+    return _ERROR + text
 
 
 def highlight(text: str) -> str:
-    return Fore.YELLOW + Style.BRIGHT + text
+    return _HIGHLIGHT + text
+
+
+@lru_cache(maxsize=1024)
+def _compile_word(word: str) -> re.Pattern:
+    return re.compile(re.escape(word), re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _overlaps_itself(word: str) -> bool:
+    # e.g. "ana" or "aa": one match can start inside another
+    return any(word.startswith(word[i:]) for i in range(1, len(word)))
 
 
 def highlight_word_in_phrase(phrase: str, word: str) -> str:
     if not phrase or not word:
         return phrase
 
-    def repl(match: re.Match) -> str:
-        return Fore.YELLOW + Style.BRIGHT + match.group(0) + Style.RESET_ALL
-
-    pattern = re.compile(re.escape(word), re.IGNORECASE)
-    return pattern.sub(repl, phrase)
+    lower = phrase.lower()
+    word_lower = word.lower()
+    if len(lower) != len(phrase) or len(word_lower) != len(word):
+        # Lowercasing changed the length (e.g. "İ"), so offsets in `lower`
+        # don't line up with `phrase` any more; let the regex engine do it.
+        return _compile_word(word).sub(_HIGHLIGHT_REPL, phrase)
+
+    if (
+        word in phrase
+        and not _overlaps_itself(word_lower)
+        and phrase.count(word) == lower.count(word_lower)
+    ):
+        # Every occurrence already has the word's exact casing: one C-level replace.
+        # Matches can't overlap, so equal counts mean the same positions.
+        return phrase.replace(word, _HIGHLIGHT + word + _RESET)
+
+    n = len(word)
+    parts: list[str] = []
+    pos = 0
+    idx = lower.find(word_lower)
+    while idx != -1:
+        parts.append(phrase[pos:idx])
+        parts.append(_HIGHLIGHT + phrase[idx:idx + n] + _RESET)
+        pos = idx + n
+        idx = lower.find(word_lower, pos)
+    if not parts:
+        return phrase
+    parts.append(phrase[pos:])
+    return "".join(parts)
 
 
 # ----------------------------
@@ -247,52 +651,226 @@ def load_words(path: Path) -> dict[str, WordEntry]:
         return {}
 
     entries: dict[str, WordEntry] = {}
-    with path.open("r", newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            word = (row.get("word") or "").strip()
-            if not word:
-                continue
-            phrase = (row.get("phrase") or "").strip()
-            history_raw = (row.get("history") or "").strip()
-            history = [h for h in history_raw.split(DATE_SEP) if h] if history_raw else []
-            entries[word] = WordEntry(word=word, phrase=phrase, history=history)
+    with path.open("r", newline="", encoding="utf-8-sig", buffering=CSV_BUFFER_SIZE) as f:
+        data = f.read()
+    reader = _split_csv(data)
+    header = next(reader, None)
+    if not header:
+        return entries
+
+    columns = _column_indices(header, *WORD_COLUMNS)
+    # Older files keep every review day in a "history" column instead of
+    # streak/last_day; those are derived from it
+    (ihist,) = _column_indices(header, "history")
+    legacy = columns[2] == -1 and ihist != -1
+    # Files written by save_words have exactly these columns in this order
+    positional = columns == tuple(range(len(WORD_COLUMNS)))
+    for row in reader:
+        if positional and len(row) == len(WORD_COLUMNS):
+            word, phrase, streak_raw, last_raw, interval_raw, due_raw = row
+        else:
+            # Reordered columns, short rows, or an older file (missing
+            # columns then read as empty)
+            word, phrase, streak_raw, last_raw, interval_raw, due_raw = (_cell(row, i) for i in columns)
+        word = _clean(word)
+        if not word:
+            continue
+        if legacy:
+            streak, last_day = _parse_history(_cell(row, ihist))
+        else:
+            streak, last_day = _parse_int(streak_raw, 0), _parse_day(last_raw, None)
+        entries[word] = WordEntry(
+            word=word,
+            phrase=_clean(phrase),
+            streak=streak,
+            last_day=last_day,
+            interval_days=_parse_int(interval_raw, 1),
+            due_on=_parse_day(due_raw, 0),
+        )
     return entries
 
 
+def _parse_history(history_raw: str) -> tuple[int, int | None]:
+    """Legacy "day|day|..." history -> (streak, last day)."""
+    streak, last_day = 0, None
+    for day in history_raw.split(DATE_SEP):
+        try:
+            last_day = to_ordinal(_clean(day))
+        except ValueError:
+            # Stray separator ("a||b", trailing "|") or a hand-edited typo
+            continue
+        streak += 1
+    return streak, last_day
+
+
+def _parse_int(raw: str, default: int) -> int:
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def _parse_day(raw: str, default: int | None) -> int | None:
+    try:
+        return to_ordinal(_clean(raw))
+    except ValueError:
+        return default
+
+
+def _split_csv(data: str):
+    """
+    Rows of a CSV document. Without any quoting (the usual case: no commas,
+    quotes or line breaks inside cells) a CSV row is just its line split on
+    commas, which is much cheaper than going through the csv module.
+    """
+    if "\r" in data:
+        data = data.replace("\r\n", "\n")
+    if '"' in data or "\r" in data:
+        return csv.reader(io.StringIO(data, newline=""))
+    return (line.split(",") if line else [] for line in data.split("\n"))
+
+
 def save_words(path: Path, entries: dict[str, WordEntry]) -> None:
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(WORD_COLUMNS)
+    writer.writerows(
+        (
+            e.word,
+            e.phrase,
+            e.streak,
+            to_isoday(e.last_day) if e.last_day else "",
+            e.interval_days,
+            to_isoday(e.due_on) if e.due_on else "",
+        )
+        for e in sorted(entries.values(), key=attrgetter("_word_lower"))
+    )
+
+    # Write a sibling file in one go and swap it in, so an interrupted save
+    # can never leave a half-written words file behind
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=["word", "phrase", "history"])
-        writer.writeheader()
-        for key in sorted(entries.keys(), key=str.lower):
-            e = entries[key]
-            writer.writerow({"word": e.word, "phrase": e.phrase, "history": DATE_SEP.join(e.history)})
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(buf.getvalue(), encoding="utf-8-sig", newline="")
+    os.replace(tmp, path)
+
 
+class AnswerJournal:
+    """
+    Append-only log of review answers next to the words CSV (word,ok,day).
+
+    A review session appends one line per answer instead of rewriting the
+    whole CSV; the CSV is written once when the session ends. If the program
+    dies mid-session, the next start replays the leftover journal.
+    """
 
-def add_word(entries: dict[str, WordEntry], word: str, phrase: str) -> None:
+    def __init__(self, path: Path):
+        self.path = path
+        self._f = None
+        self._writer = None
+
+    @property
+    def pending(self) -> bool:
+        return self._f is not None
+
+    def append(self, word: str, ok: bool, day: int) -> None:
+        if self._f is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._f = self.path.open("a", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._f)
+        self._writer.writerow((word, "1" if ok else "0", to_isoday(day)))
+        self._f.flush()
+
+    def replay(self, entries: dict[str, WordEntry]) -> bool:
+        """Apply a leftover journal to `entries`; returns True if there was one."""
+        if not self.path.exists():
+            return False
+        with self.path.open("r", newline="", encoding="utf-8") as f:
+            for row in csv.reader(f):
+                if len(row) < 3:
+                    continue  # torn last line
+                word, ok = row[0], row[1]
+                e = entries.get(word)
+                day = _parse_day(row[2], 0)
+                if e is None or not day:
+                    continue
+                e.refresh(day)
+                if ok == "1":
+                    record_success_once_per_day(e, day)
+                else:
+                    reset_streak(e, day)
+        return True
+
+    def discard(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+            self._writer = None
+        self.path.unlink(missing_ok=True)
+
+
+def add_word(entries: dict[str, WordEntry], word: str, phrase: str) -> bool:
+    """Add `word` or update its phrase; returns False if nothing changed."""
     word = word.strip()
     phrase = phrase.strip()
     if not word:
         raise ValueError("Word must not be empty.")
-    if word in entries:
-        entries[word].phrase = phrase
+    entry = entries.get(word)
+    if entry is not None:
+        if entry.phrase == phrase:
+            return False
+        entry.phrase = phrase
     else:
-        entries[word] = WordEntry(word=word, phrase=phrase, history=[])
+        entries[word] = WordEntry(word=word, phrase=phrase)
+    return True
+
 
+def refresh_entries(entries: dict[str, WordEntry], today: int) -> None:
+    """Compute the cached per-day state of every entry (once per session)."""
+    for e in entries.values():
+        e.refresh(today)
 
-def record_success_once_per_day(entry: WordEntry, today: str) -> None:
-    if entry.reviewed_today(today):
+
+def record_success_once_per_day(entry: WordEntry, today: int) -> None:
+    if entry._reviewed_today:
         return
-    entry.history.append(today)
+    entry.streak += 1
+    entry.last_day = today
+    entry.interval_days = min(entry.interval_days * 2, MAX_INTERVAL_DAYS)
+    entry.due_on = today + entry.interval_days
+    entry.refresh(today)
 
 
-def reset_streak(entry: WordEntry) -> None:
-    entry.history.clear()
+def reset_streak(entry: WordEntry, today: int) -> None:
+    entry.streak = 0
+    entry.last_day = None
+    entry.interval_days = 1
+    entry.due_on = today + 1
+    entry.refresh(today)
 
 
-def get_review_queue(entries: dict[str, WordEntry], today: str) -> list[WordEntry]:
-    return [e for e in entries.values() if (not e.mastered) and (not e.reviewed_today(today))]
+def _partition(
+    entries: dict[str, WordEntry], today: int
+) -> tuple[list[WordEntry], list[WordEntry], list[WordEntry], int]:
+    """
+    One pass over all entries. Returns (due now, not mastered, mastered,
+    number of not-mastered words already reviewed today); "due now" is a
+    subset of "not mastered".
+    """
+    due_now: list[WordEntry] = []
+    learning: list[WordEntry] = []
+    mastered: list[WordEntry] = []
+    reviewed_today = 0
+    for e in entries.values():
+        if e._mastered:
+            mastered.append(e)
+            continue
+        learning.append(e)
+        if e._reviewed_today:
+            reviewed_today += 1
+        # _reviewed_today also covers words answered today before due_on existed
+        elif e.due_on <= today:
+            due_now.append(e)
+    return due_now, learning, mastered, reviewed_today
 
 
 # ----------------------------
@@ -311,28 +889,35 @@ def add_loop(entries: dict[str, WordEntry], i18n: I18N, save_now) -> None:
 
         phrase = input(i18n.t("PHRASE_PROMPT") + " ").strip()
         # (we only treat exitnow in the word prompt; phrases may contain that string)
-        add_word(entries, word, phrase)
-        save_now()
+        if add_word(entries, word, phrase):
+            save_now()
         print(f"{i18n.t('SAVED')} {word}\n")
 
 
-def list_words(entries: dict[str, WordEntry], today: str, i18n: I18N) -> None:
-    due = sorted(
-        [e for e in entries.values() if not e.mastered],
-        key=lambda x: (x.reviewed_today(today), x.word.lower()),
-    )
-    mastered = sorted([e for e in entries.values() if e.mastered], key=lambda x: x.word.lower())
+def list_words(entries: dict[str, WordEntry], today: int, i18n: I18N) -> None:
+    _, due, mastered, _ = _partition(entries, today)
+    due.sort(key=attrgetter("_reviewed_today", "_word_lower"))
+    mastered.sort(key=attrgetter("_word_lower"))
+
+    print(i18n.t("TODAY", today=to_isoday(today)) + "\n")
 
-    print(i18n.t("TODAY", today=today) + "\n")
+    streak = i18n.formatter("STREAK")
+    last_review = i18n.formatter("LAST")
+    next_due = i18n.formatter("NEXT_DUE")
 
     print(i18n.t("DUE_TITLE"))
     if not due:
         print("  " + i18n.t("NONE"))
     else:
+        today_flag = i18n.t("TODAY_FLAG")
         for e in due:
-            flag = i18n.t("TODAY_FLAG") if e.reviewed_today(today) else " "
+            flag = today_flag if e._reviewed_today else " "
             last = e.last_review() or "-"
-            print(f"  [{flag:6}] {e.word:20}  {i18n.t('STREAK', s=e.streak, m=MASTERY_STREAK)}  {i18n.t('LAST', last=last)}")
+            line = f"  [{flag:6}] {e.word:20}  {streak(s=e.streak, m=MASTERY_STREAK)}  {last_review(last=last)}"
+            # Words review() won't ask yet, with the day they come back
+            if e.due_on > today:
+                line += "  " + next_due(due=to_isoday(e.due_on))
+            print(line)
 
     print("\n" + i18n.t("MASTERED_TITLE"))
     if not mastered:
@@ -340,61 +925,75 @@ def list_words(entries: dict[str, WordEntry], today: str, i18n: I18N) -> None:
     else:
         for e in mastered:
             last = e.last_review() or "-"
-            print(f"  {e.word:20}  {i18n.t('STREAK', s=e.streak, m=MASTERY_STREAK)}  {i18n.t('LAST', last=last)}")
+            print(f"  {e.word:20}  {streak(s=e.streak, m=MASTERY_STREAK)}  {last_review(last=last)}")
 
 
-def review(entries: dict[str, WordEntry], today: str, speaker: Speaker, i18n: I18N, save_now, username: str | None, limit: int | None = None) -> None:
-    queue = get_review_queue(entries, today)
-    already_today = len([e for e in entries.values() if (not e.mastered) and e.reviewed_today(today)])
+def review(entries: dict[str, WordEntry], today: int, speaker: Speaker, i18n: I18N, log_answer, username: str | None, limit: int | None = None) -> None:
+    queue, learning, _, already_today = _partition(entries, today)
 
     if not queue:
         if already_today > 0:
             print(i18n.t("ALL_DONE_TODAY"))
+        elif learning:
+            # Words still to learn, but none of them is due yet
+            print(i18n.t("NOTHING_DUE_TODAY"))
         else:
             print(i18n.t("NO_WORDS_DUE"))
         return
 
-    random.shuffle(queue)
-    if limit is not None:
-        queue = queue[:limit]
+    if limit is not None and 0 <= limit < len(queue):
+        # Only `limit` words are needed: pick them instead of shuffling everything
+        queue = random.sample(queue, limit)
+    else:
+        random.shuffle(queue)
+        if limit is not None:
+            queue = queue[:limit]
 
-    print(i18n.t("TODAY", today=today))
+    print(i18n.t("TODAY", today=to_isoday(today)))
     if already_today:
         print(i18n.t("ALREADY_REVIEWED_TODAY", n=already_today))
     print(i18n.t("REVIEW_START", n=len(queue), m=MASTERY_STREAK) + "\n")
     if speaker.enabled and username:
         speaker.speak_many_and_wait([f"{i18n.t('WELCOME')} {username}", i18n.t('LETSGO')])
 
+    # Per-row text: resolved once here instead of per word (PROGRESS differs
+    # on every row, so caching it in I18N.t would never hit)
+    progress = i18n.formatter("PROGRESS")
+    rule = "=" * 50
+
     for idx, e in enumerate(queue, start=1):
         if speaker.enabled:
+            # Speak prompt while allowing typing immediately; it is queued
+            # behind the previous word's "correct"/"wrong" instead of cutting it off
             if e.phrase:
-                # Speak prompt while allowing typing immediately
-                speaker.speak_many_async([e.phrase, f"{i18n.t('SAY_SPELL_NOW')} {e.word}"])
+                speaker.speak_many_async([e.phrase, f"{i18n.t('SAY_SPELL_NOW')} {e.word}"], interrupt=False)
             else:
-                speaker.speak_async(i18n.t("SAY_NEXT_WORD"))
+                speaker.speak_async(i18n.t("SAY_NEXT_WORD"), interrupt=False)
 
             while True:
                 typed = input(i18n.t("TYPE_HINT") + " ").strip()
                 speaker.stop()
+                command = typed.lower()
 
-                if typed.lower() == "a":
+                if command == "a":
                     # Play the prompt again
                     if e.phrase:
-                        speaker.speak_many_async([e.phrase, f"{i18n.t("SAY_SPELL_NOW")} {e.word}"])
+                        speaker.speak_many_async([e.phrase, f"{i18n.t('SAY_SPELL_NOW')} {e.word}"])
                     else:
                         speaker.speak_async(i18n.t("SAY_NEXT_WORD"))
                     continue
-                elif typed.lower() == "q":
+                elif command == "q":
                     # Quit session
                     if speaker.enabled:
                         speaker.speak_async(i18n.t("QUIT"))  # or QUIT message if you add one
+                        speaker.flush()
                     return
 
                 break
         else:
             # Text mode: show the phrase with the word highlighted (your earlier request)
-            print("=" * 50)
-            print(Style.BRIGHT + i18n.t("PROGRESS", i=idx, n=len(queue), s=e.streak, m=MASTERY_STREAK))
+            print(rule)
+            print(_BRIGHT + progress(i=idx, n=len(queue), s=e.streak, m=MASTERY_STREAK))
             if e.phrase:
                 highlighted = highlight_word_in_phrase(e.phrase, e.word)
                 print("  " + highlighted)
@@ -410,19 +1009,19 @@ def review(entries: dict[str, WordEntry], today: str, speaker: Speaker, i18n: I1
 
         if typed == e.word:
             record_success_once_per_day(e, today)
-            save_now()
+            log_answer(e, True)
             if speaker.enabled:
-                speaker.speak_and_wait(i18n.t("CORRECT"))
+                speaker.speak_async(i18n.t("CORRECT"), interrupt=False)
             else:
-                if e.mastered:
+                if e._mastered:
                     print(success(i18n.t("MASTERED_NOW", s=e.streak, m=MASTERY_STREAK)))
                 else:
                     print(success(i18n.t("CORRECT_STREAK", s=e.streak, m=MASTERY_STREAK)))
         else:
-            reset_streak(e)
-            save_now()
+            reset_streak(e, today)
+            log_answer(e, False)
             if speaker.enabled:
-                speaker.speak_and_wait(i18n.t("WRONG"))
+                speaker.speak_async(i18n.t("WRONG"), interrupt=False)
                 print(error(i18n.t("EXPECTED", word=highlight(e.word))))
                 print(error(i18n.t("RESET_STREAK", m=MASTERY_STREAK)))
             else:
@@ -430,12 +1029,22 @@ def review(entries: dict[str, WordEntry], today: str, speaker: Speaker, i18n: I1
                 print(error(i18n.t("EXPECTED", word=highlight(e.word))))
                 print(error(i18n.t("RESET_STREAK", m=MASTERY_STREAK)))
 
+    # Let the last "correct"/"wrong" finish before the session ends
+    speaker.flush()
     print("\n" + i18n.t("DONE"))
 
 
 # ----------------------------
 # Multi-user file selection
 # ----------------------------
+# ASCII characters other than letters, digits, "_" and "-", deleted in C by str.translate
+_DROP_UNSAFE_ASCII = str.maketrans(
+    "", "", "".join(ch for ch in map(chr, range(128)) if not (ch.isalnum() or ch in "-_"))
+)
+# Anything that isn't a (Unicode) letter, digit, "_" or "-"
+_UNSAFE_USER_CHARS = re.compile(r"[^\w-]+")
+
+
 def resolve_data_file(user: str | None, file_override: str | None, data_dir: Path) -> Path:
     if file_override:
         return Path(file_override)
@@ -443,7 +1052,10 @@ def resolve_data_file(user: str | None, file_override: str | None, data_dir: Pat
     if not user:
         return Path("words.csv")
 
-    safe = "".join(ch for ch in user.strip().lower() if ch.isalnum() or ch in ("-", "_"))
+    safe = user.strip().lower().translate(_DROP_UNSAFE_ASCII)
+    if not safe.isascii():
+        # Non-ASCII letters (e.g. "ö") are kept, other non-ASCII characters dropped
+        safe = _UNSAFE_USER_CHARS.sub("", safe)
     if not safe:
         safe = "user"
     return data_dir / f"{safe}.csv"
@@ -477,20 +1089,35 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    translations = load_translations_csv(Path(args.i18n_file))
+    translations = load_translations_csv(Path(args.i18n_file), args.language)
     i18n = I18N(language=args.language, translations=translations)
 
-    speaker = Speaker(enabled=args.speak, language=args.language)
+    if args.cmd == "setup-tts":
+        # Needs neither the word list nor a speaker
+        setup_tts_ubuntu(run_install=args.install, i18n=i18n)
+        return
 
     data_dir = Path(args.data_dir)
     path = resolve_data_file(args.user, args.file, data_dir)
 
     entries = load_words(path)
-    today = date.today().isoformat()
+    journal = AnswerJournal(path.with_suffix(".jrnl"))
+    if journal.replay(entries):
+        # A previous session ended without writing its answers back
+        save_words(path, entries)
+        journal.discard()
+    today = date.today().toordinal()
+    refresh_entries(entries, today)
 
     def save_now() -> None:
         save_words(path, entries)
 
+    def log_answer(entry: WordEntry, ok: bool) -> None:
+        journal.append(entry.word, ok, today)
+
+    # Starts no engine until something is spoken, i.e. only in review
+    speaker = Speaker(enabled=args.speak, language=args.language)
+
     try:
 
         if args.cmd == "add":
@@ -501,21 +1128,23 @@ def main() -> None:
             if not speaker.enabled:
                 print(i18n.t("USER", user=args.user or "(file override)"))
                 print(i18n.t("DATA_FILE", path=path) + "\n")
-            review(entries, today=today, speaker=speaker, i18n=i18n, username=args.user, save_now=save_now, limit=args.limit)
+            review(entries, today=today, speaker=speaker, i18n=i18n, username=args.user, log_answer=log_answer, limit=args.limit)
 
         elif args.cmd == "list":
             print(i18n.t("USER", user=args.user or "(file override)"))
             print(i18n.t("DATA_FILE", path=path) + "\n")
             list_words(entries, today=today, i18n=i18n)
-
-        elif args.cmd == "setup-tts":
-            setup_tts_ubuntu(run_install=args.install, i18n=i18n)
-            return
     
     except KeyboardInterrupt:
         print("\n" + i18n.t("CANCELLED"))
         return
 
+    finally:
+        if journal.pending:
+            save_now()
+            journal.discard()
+        speaker.close()
+
 
 if __name__ == "__main__":
     main()